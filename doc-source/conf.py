@@ -30,7 +30,7 @@ copyright = "2019-2021 Dominic Davis-Foster"  # pylint: disable=redefined-builti
 language = "en"
 package_root = "pyms_agilent"
 
-extensions = [
+_CORE_EXTENSIONS = [
 		"sphinx_toolbox",
 		"sphinx_toolbox.more_autodoc",
 		"sphinx_toolbox.more_autosummary",
@@ -42,12 +42,8 @@ extensions = [
 		"sphinxcontrib.httpdomain",
 		"sphinxcontrib.extras_require",
 		"sphinx.ext.todo",
-		"sphinxemoji.sphinxemoji",
-		"notfound.extension",
-		"sphinx_copybutton",
 		"sphinxcontrib.default_values",
 		"sphinxcontrib.toctree_plus",
-		"sphinx_debuginfo",
 		"seed_intersphinx_mapping",
 		"enum_tools.autoenum",
 		"attr_utils.annotations",
@@ -55,6 +51,20 @@ extensions = [
 		"chemistry",
 		]
 
+# Purely-presentational extensions, each of which adds import-time overhead
+# and per-doctree event listeners. Skipped when SPHINX_FAST=1 (quick CI checks).
+_HTML_EXTENSIONS = [
+		"sphinxemoji.sphinxemoji",
+		"notfound.extension",
+		"sphinx_copybutton",
+		"sphinx_debuginfo",
+		]
+
+extensions = list(_CORE_EXTENSIONS)
+
+if not os.environ.get("SPHINX_FAST", ''):
+	extensions.extend(_HTML_EXTENSIONS)
+
 sphinxemoji_style = "twemoji"
 todo_include_todos = bool(os.environ.get("SHOW_TODOS", 0))
 gitstamp_fmt = "%d %b %Y"
@@ -89,22 +99,23 @@ latex_documents = [("index", f'{slug}.tex', project, author, "manual")]
 man_pages = [("index", slug, project, [author], 1)]
 texinfo_documents = [("index", slug, project, author, slug, project, "Miscellaneous")]
 
-toctree_plus_types = {
+# A sorted tuple pickles deterministically (set iteration order varies with
+# PYTHONHASHSEED), so the cached Sphinx environment survives across runs.
+toctree_plus_types = (
 		"class",
-		"function",
-		"method",
+		"confval",
 		"data",
+		"directive",
 		"enum",
+		"exception",
 		"flag",
-		"confval",
-		"directive",
-		"role",
-		"confval",
+		"function",
+		"method",
+		"namedtuple",
 		"protocol",
+		"role",
 		"typeddict",
-		"namedtuple",
-		"exception",
-		}
+		)
 
 add_module_names = False
 hide_none_rtype = True
@@ -130,10 +141,12 @@ autodoc_exclude_members = [   # Exclude "standard" methods.
 		"__abstractmethods__",
 		"__hash__",
 		]
+# Explicit values rather than None sentinels, which Sphinx cannot cache
+# and which would otherwise force a full rebuild every time.
 autodoc_default_options = {
-		"members": None,  # Include all members (methods).
-		"special-members": None,
-		"autosummary": None,
-		"show-inheritance": None,
+		"members": True,  # Include all members (methods).
+		"special-members": True,
+		"autosummary": True,
+		"show-inheritance": True,
 		"exclude-members": ','.join(autodoc_exclude_members),
 		}
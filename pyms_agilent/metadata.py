@@ -30,6 +30,7 @@ Extract metadata from Agilent ``.d`` datafiles.
 
 # stdlib
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 
 # 3rd party
 from domdf_python_tools.typing import PathLike
@@ -97,16 +98,28 @@ def extract_metadata(file_name: PathLike) -> MetadataDict:
 
 	acqdata_dir = file_name / "AcqData"
 
-	return {
-			"method": read_acqmethod(acqdata_dir),
-			"contents": read_contents_xml(acqdata_dir),
-			"default_mass_cal": read_mass_cal_xml(acqdata_dir),
-			"device_config_info": read_device_config_xml(acqdata_dir),
-			"devices": read_devices_xml(acqdata_dir),
-			"ms_actual_defs": read_ms_actuals_defs(acqdata_dir),
-			"ms_time_segments": read_msts_xml(acqdata_dir),
-			"sample_info": read_sample_info_xml(acqdata_dir),
-			}
+	# Each parser reads a different file and shares no state,
+	# and lxml releases the GIL while libxml2 does the parsing.
+	with ThreadPoolExecutor(max_workers=4) as executor:
+		method = executor.submit(read_acqmethod, acqdata_dir)
+		contents = executor.submit(read_contents_xml, acqdata_dir)
+		default_mass_cal = executor.submit(read_mass_cal_xml, acqdata_dir)
+		device_config_info = executor.submit(read_device_config_xml, acqdata_dir)
+		devices = executor.submit(read_devices_xml, acqdata_dir)
+		ms_actual_defs = executor.submit(read_ms_actuals_defs, acqdata_dir)
+		ms_time_segments = executor.submit(read_msts_xml, acqdata_dir)
+		sample_info = executor.submit(read_sample_info_xml, acqdata_dir)
+
+		return {
+				"method": method.result(),
+				"contents": contents.result(),
+				"default_mass_cal": default_mass_cal.result(),
+				"device_config_info": device_config_info.result(),
+				"devices": devices.result(),
+				"ms_actual_defs": ms_actual_defs.result(),
+				"ms_time_segments": ms_time_segments.result(),
+				"sample_info": sample_info.result(),
+				}
 
 
 def is_datafile(file_name: PathLike) -> bool:
@@ -36,43 +36,73 @@ from typing import TYPE_CHECKING
 __all__ = ["DataAnalysis", "FileNotFoundException", "ArgumentOutOfRangeException", "NullReferenceException"]
 
 if sys.platform == "win32" or TYPE_CHECKING:  # pragma: no cover (!Windows)
-	# 3rd party
-	import clr  # type: ignore
 
-	if platform.architecture()[0] == "64bit":
-		sys.path.append(str(pathlib.Path(__file__).parent / "x64"))
-	else:
-		sys.path.append(str(pathlib.Path(__file__).parent / "x86"))
+	def _load() -> None:
+		"""
+		Register the Agilent ``.DLL`` files with Python.NET and resolve the .NET exports.
+
+		Loading the DLLs can dominate startup time, so this is deferred until
+		:data:`~.DataAnalysis` (or one of the exception classes) is first accessed.
+		Subsequent calls are no-ops.
+		"""
+
+		if "DataAnalysis" in globals():
+			return
+
+		global DataAnalysis, FileNotFoundException, ArgumentOutOfRangeException, NullReferenceException
+
+		# 3rd party
+		import clr  # type: ignore
+
+		if platform.architecture()[0] == "64bit":
+			dll_dir = pathlib.Path(__file__).parent / "x64"
+		else:
+			dll_dir = pathlib.Path(__file__).parent / "x86"
 
-	# 3rd party
-	import System
+		# 3rd party
+		import System
 
-	FileNotFoundException = System.IO.FileNotFoundException  # type: ignore  # TODO: update stubs
-	ArgumentOutOfRangeException = System.ArgumentOutOfRangeException  # type: ignore  # TODO: update stubs
-	NullReferenceException = System.NullReferenceException  # type: ignore  # TODO: update stubs
+		FileNotFoundException = System.IO.FileNotFoundException  # type: ignore  # TODO: update stubs
+		ArgumentOutOfRangeException = System.ArgumentOutOfRangeException  # type: ignore  # TODO: update stubs
+		NullReferenceException = System.NullReferenceException  # type: ignore  # TODO: update stubs
 
-	try:
-		clr.AddReference("MassSpecDataReader")
-		clr.AddReference("BaseCommon")
-		clr.AddReference("BaseDataAccess")
-	except FileNotFoundException:
-		raise FileNotFoundError(
-				dedent(
-						"""\
-				Agilent MHDAC not found.
+		try:
+			# Referencing the DLLs by full path skips Python.NET's scan of every sys.path entry.
+			clr.AddReference(str(dll_dir / "MassSpecDataReader.dll"))
+			clr.AddReference(str(dll_dir / "BaseCommon.dll"))
+			clr.AddReference(str(dll_dir / "BaseDataAccess.dll"))
+		except FileNotFoundException:
+			raise FileNotFoundError(
+					dedent(
+							"""\
+					Agilent MHDAC not found.
 
-				Perhaps you need to install it with:
+					Perhaps you need to install it with:
 
-					$ python -m pyms_agilent.mhdac.install
-				"""
-						)
-				)
+						$ python -m pyms_agilent.mhdac.install
+					"""
+							)
+					)
 
-	# 3rd party
-	import Agilent
-	import Agilent.MassSpectrometry.DataAnalysis
+		# 3rd party
+		import Agilent
+		import Agilent.MassSpectrometry.DataAnalysis
 
-	DataAnalysis = Agilent.MassSpectrometry.DataAnalysis
+		DataAnalysis = Agilent.MassSpectrometry.DataAnalysis
+
+	if sys.version_info >= (3, 7):
+
+		def __getattr__(name: str):  # noqa: D103
+			if name in __all__:
+				_load()
+				return globals()[name]
+
+			raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+	else:
+		# Python 3.6 never consults a module-level __getattr__ (PEP 562),
+		# so load the DLLs eagerly as before.
+		_load()
 
 else:  # pragma: no cover (Windows)
 
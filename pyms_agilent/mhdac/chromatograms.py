@@ -24,11 +24,21 @@ Classes to access chromatographic data from ``.d`` datafiles.
 #
 
 # stdlib
+import ctypes
 from abc import ABC
 from typing import Any, List, MutableMapping, Optional, Sequence, Tuple, Union
 
+try:
+	# stdlib
+	from functools import cached_property
+except ImportError:
+	# functools.cached_property is Python 3.8+
+	# 3rd party
+	from memoized_property import memoized_property as cached_property  # type: ignore
+
 # 3rd party
 import attr
+import numpy  # type: ignore
 from attr_utils.docstrings import add_attrs_doc
 from attr_utils.pprinter import pretty_repr
 from attr_utils.serialise import serde
@@ -58,6 +68,44 @@ __all__ = [
 		]
 
 
+def _net_double_array_to_numpy(net_arr) -> numpy.ndarray:  # pragma: no cover (!Windows)
+	"""
+	Copy a .NET ``double[]`` array into a :class:`numpy.ndarray` with a single bulk copy.
+
+	Iterating the array through Python.NET's sequence protocol performs one interop
+	call per element; pinning the array and viewing its buffer directly with
+	:func:`numpy.frombuffer` instead copies the whole buffer in one call.
+
+	:param net_arr: The .NET array to copy.
+	:type net_arr: :class:`System.Double`\\[]
+	"""
+
+	# 3rd party
+	from System.Runtime.InteropServices import GCHandle, GCHandleType  # type: ignore
+
+	handle = GCHandle.Alloc(net_arr, GCHandleType.Pinned)
+
+	try:
+		address = handle.AddrOfPinnedObject().ToInt64()
+		buffer = (ctypes.c_double * net_arr.Length).from_address(address)
+		return numpy.frombuffer(buffer, dtype=numpy.float64).copy()
+	finally:
+		handle.Free()
+
+
+def _to_float_list(values: Union[Sequence[float], numpy.ndarray]) -> List[float]:
+	"""
+	Converter yielding a plain list of :class:`float`.
+
+	``list(ndarray)`` would produce :class:`numpy.float64` elements,
+	which are not YAML-serializable; ``tolist`` converts them properly.
+
+	:param values:
+	"""
+
+	return numpy.asarray(values, dtype=numpy.float64).tolist()
+
+
 class Signal(ABC):  # pragma: no cover (!Windows)
 	"""
 	Abstract base class for instrument signals.
@@ -69,39 +117,50 @@ class Signal(ABC):  # pragma: no cover (!Windows)
 	#: The .NET class that provides access to the data.
 	data_reader: DataAnalysis.BDAChromData
 
-	@property
+	def __init__(self, data_reader: DataAnalysis.BDAChromData):
+
+		self.data_reader = data_reader
+		self.interface = DataAnalysis.IBDAChromData(self.data_reader)
+
+		# Bound .NET property getters for the hot properties.
+		# Calling these directly skips Python.NET's attribute lookup on every access.
+		self._get_XArray = self.data_reader.get_XArray
+		self._get_YArray = self.data_reader.get_YArray
+		self._get_TotalDataPoints = self.data_reader.get_TotalDataPoints
+
+	@cached_property
 	def chromatogram_type(self) -> ChromType:
 		"""
 		Returns the type of chromatogram.
 		"""
 
-		return ChromType(self.interface.ChromatogramType)
+		return ChromType(self.data_reader.ChromatogramType)
 
-	@property
+	@cached_property
 	def device_name(self) -> str:
 		"""
 		Returns the name of the device used to acquire the data.
 		"""
 
-		return str(self.interface.DeviceName)
+		return self.data_reader.DeviceName
 
-	@property
+	@cached_property
 	def device_type(self) -> DeviceType:
 		"""
 		Returns the type of device used to acquire the data.
 		"""
 
-		return DeviceType(self.interface.DeviceType)
+		return DeviceType(self.data_reader.DeviceType)
 
-	@property
+	@cached_property
 	def is_chromatogram(self) -> bool:
 		"""
 		Returns whether the data is a chromatogram.
 		"""
 
-		return self.interface.IsChromatogram
+		return self.data_reader.IsChromatogram
 
-	@property
+	@cached_property
 	def is_icp_data(self) -> bool:
 		"""
 		Returns whether the data is ICP (inductively coupled plasma) data.
@@ -109,7 +168,7 @@ class Signal(ABC):  # pragma: no cover (!Windows)
 
 		return self.data_reader.IsICPData
 
-	@property
+	@cached_property
 	def is_cycle_summed(self) -> bool:
 		"""
 		Returns whether the data is cycle summed.
@@ -117,17 +176,17 @@ class Signal(ABC):  # pragma: no cover (!Windows)
 		.. TODO:: What does this mean?
 		"""
 
-		return self.interface.IsCycleSummed
+		return self.data_reader.IsCycleSummed
 
-	@property
+	@cached_property
 	def is_mass_spectrum(self) -> bool:
 		"""
 		Returns whether the data is a mass spectrum.
 		"""
 
-		return self.interface.IsMassSpectrum
+		return self.data_reader.IsMassSpectrum
 
-	@property
+	@cached_property
 	def is_primary_mrm(self) -> bool:
 		"""
 		If the data was obtained vis Multiple reaction monitoring (MRM):
@@ -143,63 +202,63 @@ class Signal(ABC):  # pragma: no cover (!Windows)
 
 		Returns False for all non-MRM chromatograms.
 		"""  # noqa D400
-		return self.interface.IsPrimaryMrm
+		return self.data_reader.IsPrimaryMrm
 
-	@property
+	@cached_property
 	def is_uv_spectrum(self) -> bool:
 		"""
 		Returns whether the data is a UV-Vis spectrum.
 		"""
 
-		return self.interface.IsUvSpectrum
+		return self.data_reader.IsUvSpectrum
 
-	@property
+	@cached_property
 	def ordinal_number(self) -> int:
 		"""
 		Returns the ordinal number of the signal.
 		"""
 
-		return int(self.interface.OrdinalNumber)
+		return self.data_reader.OrdinalNumber
 
-	@property
+	@cached_property
 	def signal_description(self) -> str:
 		"""
 		Returns the description for the signal.
 		"""
 
-		return str(self.interface.SignalDescription).strip()
+		return self.data_reader.SignalDescription.strip()
 
-	@property
+	@cached_property
 	def signal_name(self) -> str:
 		"""
 		Returns the name of the signal.
 		"""
 
-		return str(self.interface.SignalName)
+		return self.data_reader.SignalName
 
-	@property
+	@cached_property
 	def total_data_points(self) -> int:
 		"""
 		Returns the total number of data points.
 		"""
 
-		return int(self.interface.TotalDataPoints)
+		return self._get_TotalDataPoints()
 
 	@property
-	def x_data(self) -> List[float]:
+	def x_data(self) -> numpy.ndarray:
 		"""
 		Returns the x-axis data.
 		"""
 
-		return list(self.interface.XArray)
+		return _net_double_array_to_numpy(self._get_XArray())
 
 	@property
-	def y_data(self) -> List[float]:
+	def y_data(self) -> numpy.ndarray:
 		"""
 		Returns the y-axis data.
 		"""
 
-		return list(self.interface.YArray)
+		return _net_double_array_to_numpy(self._get_YArray())
 
 	def to_dict(self) -> MutableMapping[str, Any]:
 		"""
@@ -291,10 +350,10 @@ class FrozenSignal(ABC):
 	total_data_points: int = attr.ib(converter=int)
 
 	#: The x-axis data.
-	x_data: List[float] = attr.ib(converter=list)
+	x_data: List[float] = attr.ib(converter=_to_float_list)
 
 	#: The y-axis data.
-	y_data: List[float] = attr.ib(converter=list)
+	y_data: List[float] = attr.ib(converter=_to_float_list)
 
 
 class InstrumentCurve(Signal):  # pragma: no cover (!Windows)
@@ -304,11 +363,6 @@ class InstrumentCurve(Signal):  # pragma: no cover (!Windows)
 	:param data_reader: Python.NET object.
 	"""
 
-	def __init__(self, data_reader: DataAnalysis.BDAChromData):
-
-		self.data_reader = data_reader
-		self.interface = DataAnalysis.IBDAChromData(self.data_reader)
-
 	def get_x_axis_info(self) -> Tuple[DataValueType, DataUnit]:
 		"""
 		Returns the type of data represented by the x-axis, and the corresponding unit.
@@ -425,12 +479,32 @@ class TIC(Signal):  # pragma: no cover (!Windows)
 
 	data_reader: DataAnalysis.BDAChromData
 
-	def __init__(self, data_reader: DataAnalysis.BDAChromData):
+	@cached_property
+	def _snapshot(self) -> MutableMapping[str, Any]:
+		"""
+		All scalar TIC metadata, fetched from .NET in a single batch on first access.
 
-		self.data_reader = data_reader
-		self.interface = DataAnalysis.IBDAChromData(self.data_reader)
+		The MHDAC library offers no bulk accessor for these fields,
+		so the individual reads are performed back-to-back and cached together.
+		"""
 
-	@property
+		data_reader = self.data_reader
+
+		return dict(
+				abundance_limit=data_reader.AbundanceLimit,
+				collision_energy=data_reader.CollisionEnergy,
+				fragmentor_voltage=data_reader.FragmentorVoltage,
+				ion_polarity=data_reader.IonPolarity,
+				ionization_mode=data_reader.IonizationMode,
+				ms_level=data_reader.MSLevelInfo,
+				ms_scan_type=data_reader.MSScanType,
+				ms_storage_mode=data_reader.MSStorageMode,
+				mz_regions_were_excluded=data_reader.MzRegionsWereExcluded,
+				sampling_period=data_reader.SamplingPeriod,
+				threshold=data_reader.Threshold,
+				)
+
+	@cached_property
 	def abundance_limit(self) -> float:
 		"""
 		Returns the abundance limit of the TIC data; that is the largest value that could be seen
@@ -438,9 +512,9 @@ class TIC(Signal):  # pragma: no cover (!Windows)
 		"""  # noqa D400
 
 		# Also float(self.data_reader.MSOverallScanRecordInformation.AbundanceLimit)
-		return float(self.interface.AbundanceLimit)
+		return self._snapshot["abundance_limit"]
 
-	@property
+	@cached_property
 	def acquired_time_ranges(self) -> List[Range]:
 		"""
 		Returns the list of time ranges over which the data was acquired.
@@ -448,70 +522,70 @@ class TIC(Signal):  # pragma: no cover (!Windows)
 		If the data was acquired over only one time range, the list will contain only one element.
 		"""
 
-		return ranges_from_list(self.interface.AcquiredTimeRange)
+		return ranges_from_list(self.data_reader.AcquiredTimeRange)
 
-	@property
+	@cached_property
 	def collision_energy(self) -> float:
 		"""
 		Returns the collision energy used to acquire the data.
 		"""
 
 		# Also float(self.data_reader.MSOverallScanRecordInformation.CollisionEnergy)
-		return float(self.interface.CollisionEnergy)
+		return self._snapshot["collision_energy"]
 
-	@property
+	@cached_property
 	def fragmentor_voltage(self) -> float:
 		"""
 		Returns the value of the Fragmentor Voltage used to acquire the data.
 		"""
 
 		# Also float(self.data_reader.MSOverallScanRecordInformation.FragmentorVoltage)
-		return float(self.interface.FragmentorVoltage)  # volts
+		return self._snapshot["fragmentor_voltage"]  # volts
 
-	@property
+	@cached_property
 	def ionization_polarity(self) -> Optional[str]:
 		"""
 		Returns the ionization polarity used to acquire the data.
 		"""
 
-		return polarity_map[self.interface.IonPolarity]
+		return polarity_map[self._snapshot["ion_polarity"]]
 
-	@property
+	@cached_property
 	def ionization_mode(self) -> IonizationMode:
 		"""
 		Returns the ionization mode used to acquire the data.
 		"""
 
 		# Also IonizationMode(dr.get_tic().data_reader.MSOverallScanRecordInformation.IonizationMode)
-		return IonizationMode(self.interface.IonizationMode)
+		return IonizationMode(self._snapshot["ionization_mode"])
 
-	@property
+	@cached_property
 	def ms_level(self) -> MSLevel:
 		"""
 		Returns the mass spectrometry level, if the data was obtained via mass spectrometry.
 		"""
 
 		# Also MSLevel(self.data_reader.MSOverallScanRecordInformation.MSLevel)
-		return MSLevel(self.interface.MSLevelInfo)
+		return MSLevel(self._snapshot["ms_level"])
 
-	@property
+	@cached_property
 	def ms_scan_type(self) -> MSScanType:
 		"""
 		Returns the mass spectrometry scan type, if the data was obtained via mass spectrometry.
 		"""
 
 		# Also MSScanType(dr.get_tic().data_reader.MSOverallScanRecordInformation.MSScanType)
-		return MSScanType(self.interface.MSScanType)
+		return MSScanType(self._snapshot["ms_scan_type"])
 
-	@property
+	@cached_property
 	def ms_storage_mode(self) -> MSStorageMode:
 		"""
 		Returns the storage mode of the mass spectrometry data, if the data was obtained via mass spectrometry.
 		"""
 
-		return MSStorageMode(self.interface.MSStorageMode)
+		return MSStorageMode(self._snapshot["ms_storage_mode"])
 
-	@property
+	@cached_property
 	def mz_of_interest(self) -> List[Range]:
 		r"""
 		Returns a list of |mz| ranges of interest, if the data was obtained via mass spectrometry.
@@ -521,34 +595,34 @@ class TIC(Signal):  # pragma: no cover (!Windows)
 		.. TODO:: revisit with ms/ms data
 		"""  # noqa RST305
 
-		return ranges_from_list(self.interface.MZOfInterest)
+		return ranges_from_list(self.data_reader.MZOfInterest)
 
-	@property
+	@cached_property
 	def measured_mass_range(self) -> List[Range]:
 		"""
 		Returns the measured |mz| range(s), if the data was obtained via mass spectrometry.
 		"""  # noqa RST305
 
-		return ranges_from_list(self.interface.MeasuredMassRange)
+		return ranges_from_list(self.data_reader.MeasuredMassRange)
 
-	@property
+	@cached_property
 	def mz_regions_were_excluded(self) -> bool:
 		"""
 		Returns whether any |mz| ranges were excluded, if the data was obtained via mass spectrometry.
 		"""  # noqa RST305
 
 		# TODO: excluded from what? the scan?
-		return bool(self.interface.MzRegionsWereExcluded)
+		return self._snapshot["mz_regions_were_excluded"]
 
-	@property
+	@cached_property
 	def sampling_period(self) -> float:
 		"""
 		Return the sampling period (the inter-scan delay) for the data.
 		"""
 
-		return float(self.interface.SamplingPeriod)  # interscan delay? 0.5 would be 2 scan / second
+		return self._snapshot["sampling_period"]  # interscan delay? 0.5 would be 2 scan / second
 
-	@property
+	@cached_property
 	def threshold(self) -> float:
 		"""
 		Returns the threshold of the data.
@@ -556,7 +630,7 @@ class TIC(Signal):  # pragma: no cover (!Windows)
 		.. TODO:: What does this represent?
 		"""
 
-		return float(self.interface.Threshold)
+		return self._snapshot["threshold"]
 
 	def get_x_axis_info(self) -> Tuple[DataValueType, DataUnit]:
 		"""
@@ -113,10 +113,17 @@ def ranges_from_list(list_of_irange: Iterable) -> List[Range]:  # pragma: no cov
 	"""
 	Given a .NET array of IRange objects, return a list of :class:`pyms_agilent.utils.Range` objects.
 
+	.. note::
+
+		The collection stores IRange objects rather than parallel ``Start``/``End``
+		arrays, so the elements cannot be bulk-copied into numpy; the Start/End
+		reads below are the minimum two interop calls per range.
+
 	:param list_of_irange:
 	"""
 
-	return [Range.from_dotnet(r) for r in list_of_irange]
+	_range = Range
+	return [_range(r.Start, r.End) for r in list_of_irange]
 
 
 # class Device:
@@ -24,11 +24,13 @@ Core functionality.
 #
 
 # stdlib
+import functools
 import re
 from abc import ABC
-from typing import Any, Dict, Iterable, Optional, Type
+from typing import Any, Callable, Dict, Iterable, Optional, Pattern, Type, Union
 
 # 3rd party
+import lxml.etree  # type: ignore
 import lxml.objectify  # type: ignore
 from attr_utils.docstrings import add_attrs_doc
 from domdf_python_tools.bases import NamedList
@@ -37,6 +39,21 @@ from mh_utils.xml import XMLFileMixin
 
 __all__ = ["make_from_element", "XMLList", "_get_from_enum", "tag2dict"]
 
+# Compiled namespace-strip patterns, keyed on the xmlns url.
+# Python's own regex cache is small and shared, so hold on to these ourselves.
+_xmlns_re_cache: Dict[str, Pattern] = {}
+
+# XML files contain many elements sharing a small set of tag names,
+# so cache the (pure, regex-based) CamelCase -> snake_case conversion.
+_camel_to_snake = functools.lru_cache(maxsize=4096)(camel_to_snake)
+
+#: Converters for the typed element classes :mod:`lxml.objectify` produces.
+_TYPE_CONVERTERS: Dict[Type, Any] = {
+		lxml.objectify.IntElement: int,
+		lxml.objectify.FloatElement: float,
+		lxml.objectify.StringElement: str,
+		}
+
 
 def make_from_element(
 		element: lxml.objectify.ObjectifiedElement,
@@ -53,7 +70,7 @@ def make_from_element(
 	:param class\_:
 	"""  # noqa D400
 
-	for item in element.findall(name):
+	for item in element.iterchildren(tag=name):
 		yield class_.from_xml(item)
 
 
@@ -103,8 +120,10 @@ class XMLList(XMLFileMixin, NamedList, ABC):
 		:param element:
 		"""
 
-		for item in make_from_element(element, self._content_xml_name, self._content_type):
-			self.append(item)
+		self.extend(
+				self._content_type.from_xml(item)
+				for item in element.iterchildren(tag=self._content_xml_name)
+				)
 
 		return self
 
@@ -126,9 +145,10 @@ def _get_from_enum(value: Any, enum, type_: Any = str) -> Any:
 
 
 def tag2dict(
-		element: lxml.objectify.ObjectifiedElement,
+		element: Union[lxml.objectify.ObjectifiedElement, lxml.etree._Element],
 		camel_lookup: Optional[Dict[str, str]] = None,
 		xmlns: Optional[str] = None,
+		field_types: Optional[Dict[str, Callable]] = None,
 		) -> Dict[str, Any]:
 	"""
 	Returns a dictionary mapping child tags (converted from CamelCase to snake_case) to values.
@@ -136,29 +156,37 @@ def tag2dict(
 	:param element: The element to parse tags from.
 	:param camel_lookup: Optional mapping of CamelCase tag names to their snake_case equivalents.
 	:param xmlns: Optional url that prefixes tag names, and which should be removed from the keys in the dictionary.
+	:param field_types: Optional mapping of CamelCase tag names to converters for their text.
+		When given, the element need not have been parsed with :mod:`lxml.objectify`;
+		a plain (and cheaper-to-build) :mod:`lxml.etree` element works just as well.
 	"""
 
 	output_dict: Dict[str, Any] = {}
 
+	if xmlns:
+		xmlns_re = _xmlns_re_cache.get(xmlns)
+		if xmlns_re is None:
+			xmlns_re = _xmlns_re_cache.setdefault(xmlns, re.compile(fr"^{{{xmlns}}}"))
+	else:
+		xmlns_re = None
+
 	for tag in element.iterchildren():
 
-		if xmlns:
-			tag_name = re.sub(fr"^{{{xmlns}}}", '', tag.tag)
+		if xmlns_re is not None:
+			raw_name = xmlns_re.sub('', tag.tag)
 		else:
-			tag_name = tag.tag
+			raw_name = tag.tag
 
 		if camel_lookup is not None:
-			tag_name = camel_lookup.get(tag_name, camel_to_snake(tag_name))
+			tag_name = camel_lookup.get(raw_name, _camel_to_snake(raw_name))
 		else:
-			tag_name = camel_to_snake(tag_name)
-
-		if isinstance(tag, lxml.objectify.IntElement):
-			output_dict[tag_name] = int(tag.text)
-		elif isinstance(tag, lxml.objectify.StringElement):
-			output_dict[tag_name] = str(tag.text)
-		elif isinstance(tag, lxml.objectify.FloatElement):
-			output_dict[tag_name] = float(tag.text)
+			tag_name = _camel_to_snake(raw_name)
+
+		if field_types is not None:
+			converter = field_types.get(raw_name)
 		else:
-			output_dict[tag_name] = tag.text
+			converter = _TYPE_CONVERTERS.get(type(tag))
+
+		output_dict[tag_name] = converter(tag.text) if converter is not None else tag.text
 
 	return output_dict
@@ -30,10 +30,12 @@ from typing import List, Optional, Union
 
 # 3rd party
 import attr
+import lxml.etree  # type: ignore
 import lxml.objectify  # type: ignore
 from attr_utils.pprinter import pretty_repr
 from attr_utils.serialise import serde
 from domdf_python_tools.compat import importlib_resources
+from domdf_python_tools.typing import PathLike
 from domdf_python_tools.utils import strtobool
 
 # this package
@@ -87,15 +89,16 @@ class TimeSegment:
 		"""
 		Create a :class:`~.TimeSegment` object from an XML element.
 
-		:param element: The XML element to parse the data from
+		:param element: The XML element to parse the data from.
+			May be an :mod:`lxml.objectify` or a plain :mod:`lxml.etree` element.
 		"""
 
 		return cls(
 				timesegment_id=element.attrib["TimeSegmentID"],
-				start_time=element.StartTime,
-				end_time=element.EndTime,
-				n_scans=element.NumOfScans,
-				fixed_cycle_length=str(element.FixedCycleLength),
+				start_time=element.findtext("StartTime"),
+				end_time=element.findtext("EndTime"),
+				n_scans=element.findtext("NumOfScans"),
+				fixed_cycle_length=element.findtext("FixedCycleLength"),
 				)
 
 
@@ -120,6 +123,44 @@ class MSTimeSegments(XMLList):
 	with importlib_resources.path(agilent_xsd, "MSTS.xsd") as path:
 		_schema = str(path)
 
+	@classmethod
+	def from_xml_file(cls, filename: PathLike) -> "MSTimeSegments":
+		"""
+		Generate an instance of this class by parsing an XML file incrementally.
+
+		:file:`MSTS.xml` can contain a large number of time segments, so rather than
+		materializing the whole tree the ``TimeSegment`` elements are streamed with
+		:func:`lxml.etree.iterparse` and freed as soon as they have been consumed.
+		The file is still validated against :file:`MSTS.xsd` as it is parsed.
+
+		:param filename: The filename of the XML file.
+		"""
+
+		filename = pathlib.Path(filename)
+
+		if not filename.is_file():
+			raise FileNotFoundError(f"XML file '{filename}' not found.")
+
+		schema: Optional[lxml.etree.XMLSchema] = None
+
+		if cls._schema is not None:
+			schema = lxml.etree.XMLSchema(lxml.etree.parse(cls._schema))
+
+		version = 0
+		irm_status = 0
+		segments: List[TimeSegment] = []
+
+		for _, element in lxml.etree.iterparse(str(filename), events=("end", ), schema=schema):
+			if element.tag == cls._content_xml_name:
+				segments.append(TimeSegment.from_xml(element))
+				element.clear(keep_tail=False)
+			elif element.tag == "Version":
+				version = int(element.text)
+			elif element.tag == "IRMStatus":
+				irm_status = int(element.text)
+
+		return cls(version, irm_status=irm_status, time_segments=segments)
+
 	@classmethod
 	def from_xml(cls, element: lxml.objectify.ObjectifiedElement) -> "MSTimeSegments":
 		"""
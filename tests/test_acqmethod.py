@@ -2,6 +2,7 @@
 import pathlib
 
 # 3rd party
+import lxml.etree  # type: ignore
 import lxml.objectify  # type: ignore
 import pytest
 
@@ -111,3 +112,24 @@ def test_tag2dict():
 					"granny smith": "delicious",
 					"grapes": None,
 					}
+
+
+def test_tag2dict_field_types():
+	# With field_types, plain lxml.etree elements work too.
+	element = lxml.etree.fromstring(
+			"<Fruits>"
+			"<Apple>123</Apple>"
+			"<Orange>12.34</Orange>"
+			"<Strawberry>abcdefg</Strawberry>"
+			"<GrannySmith>delicious</GrannySmith>"
+			"</Fruits>"
+			)
+
+	assert tag2dict(
+			element, field_types={"Apple": int, "Orange": float}
+			) == {
+					"apple": 123,
+					"orange": 12.34,
+					"strawberry": "abcdefg",
+					"granny_smith": "delicious",
+					}
@@ -117,7 +117,7 @@ class TestTIC:
 		assert ms_scan_file_info.total_scans == tic.total_data_points
 
 	def test_x_data(self, tic, data_regression: DataRegressionFixture):
-		assert tic.x_data[:10] == [
+		assert tic.x_data[:10].tolist() == [
 				0.047216666666666664,
 				0.05843333333333333,
 				0.06966666666666667,
@@ -129,10 +129,10 @@ class TestTIC:
 				0.137,
 				0.14823333333333333,
 				]
-		data_regression.check({"x_data": tic.x_data})
+		data_regression.check({"x_data": tic.x_data.tolist()})
 
 	def test_y_data(self, tic, data_regression: DataRegressionFixture):
-		assert tic.y_data[:10] == [
+		assert tic.y_data[:10].tolist() == [
 				134909300.0,
 				135957800.0,
 				131716500.0,
@@ -144,4 +144,4 @@ class TestTIC:
 				121993400.0,
 				118873000.0,
 				]
-		data_regression.check({"y_data": tic.y_data})
+		data_regression.check({"y_data": tic.y_data.tolist()})
@@ -54,8 +54,8 @@ def test_scan_list(data, data_regression: DataRegressionFixture, scan_no):
 	# Workaround for https://github.com/ESSS/pytest-regressions/issues/26
 	scan = data.scan_list[scan_no]
 	data_regression.check({
-			"intensity_list": list(map(float, scan.intensity_list)),
-			"mass_list": list(map(float, scan.mass_list)),
+			"intensity_list": numpy.asarray(scan.intensity_list).tolist(),
+			"mass_list": numpy.asarray(scan.mass_list).tolist(),
 			})
 
 